@@ -1,7 +1,17 @@
+import csv
+import hashlib
 import os
+import shutil
 import streamlit as st
+import numpy as np
 import pandas as pd
-import altair as alt
+import pyarrow as pa
+
+# Copy-on-Write: derived frames share buffers with their inputs until one
+# side is modified, so normalization doesn't need defensive deep copies.
+# pandas 3 always behaves this way and warns if the option is set.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
 
 st.set_page_config(page_title="SAS to ETL Migration Dashboard", layout="wide")
 
@@ -34,34 +44,140 @@ STATUS_FLAG_MAPPING = {
 }
 
 RESERVED_CSV_PATH = "latest_etl.csv"
+# Typed, columnar copy of RESERVED_CSV_PATH so cold starts skip CSV parsing
+RESERVED_PARQUET_PATH = "latest_etl.parquet"
+# Uploads are persisted in chunks of this size rather than as one blob
+UPLOAD_COPY_CHUNK_BYTES = 8 * 1024 * 1024
+# Bytes read from each end of the saved CSV when fingerprinting it
+FINGERPRINT_EDGE_BYTES = 4096
+
+# Raw CSV columns the dashboard actually reads; everything else is skipped
+# at parse time.
+SOURCE_COLUMNS = ["PRCS AREA CODE", "Dev Group Name", "Status", "Status Name"]
+
+VEGA_LITE_SCHEMA = "https://vega.github.io/schema/vega-lite/v5.json"
 
 
 # -------------------------------------------------------------------
 # Data loading: upload CSV + remember last file
 # -------------------------------------------------------------------
-@st.cache_data(show_spinner=False)
-def load_df(uploaded_file):
+def read_etl_csv(path):
+    """
+    Parse an ETL CSV with the multi-threaded PyArrow reader, keeping only
+    the SOURCE_COLUMNS present in the file's header.
     """
-    1. If user uploads a file this run, read it and also save it
-       to RESERVED_CSV_PATH.
-    2. If no file uploaded, but RESERVED_CSV_PATH exists, use that.
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    usecols = [c for c in header if c in SOURCE_COLUMNS]
+
+    return pd.read_csv(
+        path,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        usecols=usecols or None,
+    )
+
+
+def save_parquet_snapshot(df):
+    df.to_parquet(
+        RESERVED_PARQUET_PATH,
+        engine="pyarrow",
+        compression="zstd",
+        index=False,
+    )
+
+
+def parquet_snapshot_is_fresh():
+    return (
+        os.path.exists(RESERVED_PARQUET_PATH)
+        and os.path.getmtime(RESERVED_PARQUET_PATH) >= os.path.getmtime(RESERVED_CSV_PATH)
+    )
+
+
+def read_raw_df(uploaded_file):
+    """
+    1. If user uploads a file this run, save it to RESERVED_CSV_PATH,
+       read it from there and snapshot it to RESERVED_PARQUET_PATH.
+    2. If no file uploaded, but RESERVED_CSV_PATH exists, use the Parquet
+       snapshot when it is up to date, otherwise reparse the CSV.
     3. Otherwise, return empty DataFrame.
     """
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
         # persist last-uploaded file for future runs
+        uploaded_file.seek(0)
         with open(RESERVED_CSV_PATH, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+            shutil.copyfileobj(uploaded_file, f, length=UPLOAD_COPY_CHUNK_BYTES)
+        df = read_etl_csv(RESERVED_CSV_PATH)
+        save_parquet_snapshot(df)
         return df
 
     # No new upload this run – try to use last saved CSV
     if os.path.exists(RESERVED_CSV_PATH):
-        return pd.read_csv(RESERVED_CSV_PATH)
+        if parquet_snapshot_is_fresh():
+            return pd.read_parquet(
+                RESERVED_PARQUET_PATH,
+                engine="pyarrow",
+                dtype_backend="pyarrow",
+            )
+        df = read_etl_csv(RESERVED_CSV_PATH)
+        save_parquet_snapshot(df)
+        return df
 
     # Nothing available yet
     return pd.DataFrame()
 
 
+def edge_hash(f, size):
+    """
+    SHA-256 over the file size plus its first and last
+    FINGERPRINT_EDGE_BYTES, i.e. O(8 KB) regardless of file size.
+    """
+    f.seek(0)
+    header = f.read(FINGERPRINT_EDGE_BYTES)
+    f.seek(max(size - FINGERPRINT_EDGE_BYTES, 0))
+    trailer = f.read(FINGERPRINT_EDGE_BYTES)
+    f.seek(0)
+    return hashlib.sha256(size.to_bytes(8, "little") + header + trailer).hexdigest()
+
+
+def data_fingerprint(uploaded_file):
+    """
+    Cheap cache key for whatever read_raw_df would load this run:
+    the uploaded file, else the saved CSV (plus its mtime), else None.
+
+    Uploads are keyed on Streamlit's per-upload file_id, since an edge
+    hash can't tell apart two same-size files that differ mid-file.
+    """
+    if uploaded_file is not None:
+        return "upload:" + uploaded_file.file_id
+
+    if os.path.exists(RESERVED_CSV_PATH):
+        stat = os.stat(RESERVED_CSV_PATH)
+        with open(RESERVED_CSV_PATH, "rb") as f:
+            return f"saved:{stat.st_mtime_ns}:" + edge_hash(f, stat.st_size)
+
+    return None
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_df(fingerprint, _uploaded_file):
+    """
+    Read the raw ETL data (see read_raw_df) and normalize it once, so
+    every rerun reuses the cached, normalized frame. Returns None when
+    there is no data to load, checked before normalization so a file
+    whose rows are all CNN still counts as loaded.
+
+    Cached on `fingerprint` only (see data_fingerprint); the leading
+    underscore keeps Streamlit from hashing the full upload on every
+    rerun. The cached frame is shared between reruns, so treat it as
+    read-only.
+    """
+    df = read_raw_df(_uploaded_file)
+    if df.empty:
+        return None
+    return normalize_and_derive_flags(df)
+
+
 def normalize_and_derive_flags(df: pd.DataFrame) -> pd.DataFrame:
     """
     - Rename incoming CSV columns to internal names:
@@ -71,9 +187,8 @@ def normalize_and_derive_flags(df: pd.DataFrame) -> pd.DataFrame:
     - Drop CNN rows (Conversion Not Needed).
     - Convert ?, null, empty to PEND (Not Started).
     - Derive flag columns based on STATUS_FLAG_MAPPING.
+    - Store project / dev_grp_name as categoricals.
     """
-    df = df.copy()
-
     # Rename to friendlier internal names (only if present)
     rename_map = {}
     if "PRCS AREA CODE" in df.columns:
@@ -99,12 +214,12 @@ def normalize_and_derive_flags(df: pd.DataFrame) -> pd.DataFrame:
 
     # Normalize some empties
     df["status_code"] = df["status_code"].replace(
-        {"nan": "", "NaN": "", "None": "", "none": ""}
+        {"nan": "", "NaN": "", "None": "", "none": "", "<NA>": ""}
     )
 
     # Drop Conversion Not Needed (CNN)
     mask_cnn = df["status_code"].str.upper() == "CNN"
-    df = df[~mask_cnn].copy()
+    df = df.loc[~mask_cnn]
 
     # Treat ?, empty, null as PEND (Not Started)
     df["status_code"] = df["status_code"].where(
@@ -112,56 +227,82 @@ def normalize_and_derive_flags(df: pd.DataFrame) -> pd.DataFrame:
         other="PEND",
     )
 
-    # Now create a normalized lowercase version for easy matching
-    df["status_code_norm"] = df["status_code"].str.lower().str.strip()
+    # Map each status code to the index of its flag column in a single pass,
+    # then one-hot expand. Unmapped codes (PEND etc.) get -1 → no flags.
+    flag_cols = list(STATUS_FLAG_MAPPING.keys())
+    code_to_flag = {
+        code.lower(): i
+        for i, codes in enumerate(STATUS_FLAG_MAPPING.values())
+        for code in codes
+    }
+    flag_idx = (
+        df["status_code"].str.lower().str.strip()
+          .map(code_to_flag)
+          .fillna(-1)
+          .astype(np.int8)
+          .to_numpy()
+    )
+
+    flags = np.zeros((len(df), len(flag_cols)), dtype=np.int8)
+    mapped = flag_idx >= 0
+    flags[mapped, flag_idx[mapped]] = 1
 
-    # Initialize all flag columns to 0
-    for flag_col in STATUS_FLAG_MAPPING.keys():
-        df[flag_col] = 0
+    for i, flag_col in enumerate(flag_cols):
+        df[flag_col] = flags[:, i]
 
-    # Set flags based on status code
-    for flag_col, codes in STATUS_FLAG_MAPPING.items():
-        if not codes:
+    # Categorical keys so groupby / isin work on integer codes, not strings
+    for key_col in ("project", "dev_grp_name"):
+        if key_col not in df.columns:
             continue
-        normalized_codes = [c.lower() for c in codes]
-        df.loc[
-            df["status_code_norm"].isin(normalized_codes),
-            flag_col
-        ] = 1
+        key = df[key_col]
+        # A column that is blank in every row comes back from PyArrow as
+        # null-typed, which can't back a categorical; read it as strings.
+        if isinstance(key.dtype, pd.ArrowDtype) and pa.types.is_null(key.dtype.pyarrow_dtype):
+            key = key.astype("string")
+        df[key_col] = key.astype("category")
 
     return df
 
 
 @st.cache_data(show_spinner=False)
-def clean_and_filter(df, dev_grp_filter=None, project_filter=None):
-    df = normalize_and_derive_flags(df)
+def apply_filters(df, dev_grp_filter=None, project_filter=None):
+    # Filters are frozensets. Selecting every category (with no missing keys
+    # to drop) keeps every row, so skip the isin scan in that default case.
+    def selects_all(col, selection):
+        return selection == frozenset(df[col].cat.categories) and not df[col].hasnans
 
-    if dev_grp_filter:
-        df = df[df["dev_grp_name"].isin(dev_grp_filter)]
-    if project_filter:
-        df = df[df["project"].isin(project_filter)]
+    if dev_grp_filter and not selects_all("dev_grp_name", dev_grp_filter):
+        df = df[df["dev_grp_name"].isin(list(dev_grp_filter))]
+    if project_filter and not selects_all("project", project_filter):
+        df = df[df["project"].isin(list(project_filter))]
 
     return df
 
 
 @st.cache_data(show_spinner=False)
 def build_summary(df: pd.DataFrame) -> pd.DataFrame:
-    summary = (
-        df.groupby(["project", "dev_grp_name"], dropna=False)
-          .agg(
-              total=("dev_grp_name", "size"),
-              spec_in_pgrs=("spec_in_pgrs_cnt", "sum"),
-              spec_done=("spec_done_cnt", "sum"),
-              etl_in_pgrs=("etl_in_pgrs_cnt", "sum"),
-              etl_done=("etl_done_cnt", "sum"),
-              qa_in_pgrs=("qa_in_pgrs_cnt", "sum"),
-              qa_done=("qa_done_cnt", "sum"),
-              acc_done=("acc_done_cnt", "sum"),
-              prod_done=("prod_done_cnt", "sum"),
-          )
-          .reset_index()
-    )
-    return summary
+    # flag column → summary column, in display order
+    summary_cols = {
+        "spec_in_pgrs_cnt": "spec_in_pgrs",
+        "spec_done_cnt": "spec_done",
+        "etl_in_pgrs_cnt": "etl_in_pgrs",
+        "etl_done_cnt": "etl_done",
+        "qa_in_pgrs_cnt": "qa_in_pgrs",
+        "qa_done_cnt": "qa_done",
+        "acc_done_cnt": "acc_done",
+        "prod_done_cnt": "prod_done",
+    }
+
+    gb = df.groupby(["project", "dev_grp_name"], dropna=False, observed=True, sort=False)
+
+    # One reduction over the whole flag block instead of one agg per column
+    summary = gb[list(summary_cols)].sum().rename(columns=summary_cols)
+    summary.insert(0, "total", gb.size().to_numpy())
+
+    # Plain int32 counts, so rows come out of itertuples as Python ints
+    count_cols = ["total", *summary_cols.values()]
+    summary = summary.astype({c: "int32" for c in count_cols})
+    return summary.reset_index()
 
 
 # -------------------------------------------------------------------
@@ -170,22 +311,20 @@ def build_summary(df: pd.DataFrame) -> pd.DataFrame:
 st.sidebar.header("Filters")
 
 uploaded = st.sidebar.file_uploader("Upload latest ETL CSV", type=["csv"])
-df_raw = load_df(uploaded)
+df_raw = load_df(data_fingerprint(uploaded), uploaded)
 
-if df_raw.empty:
+if df_raw is None:
     st.warning("Upload an ETL CSV to get started. No previous file found.")
     st.stop()
 
-# Normalize for filtering
-df_raw = normalize_and_derive_flags(df_raw)
-
-projects = sorted(df_raw["project"].dropna().unique().tolist()) if "project" in df_raw.columns else []
-group_names = sorted(df_raw["dev_grp_name"].dropna().unique().tolist()) if "dev_grp_name" in df_raw.columns else []
+# Keys are categorical, so the distinct values are just the categories
+projects = sorted(df_raw["project"].cat.categories.tolist()) if "project" in df_raw.columns else []
+group_names = sorted(df_raw["dev_grp_name"].cat.categories.tolist()) if "dev_grp_name" in df_raw.columns else []
 
 proj_sel = st.sidebar.multiselect("Project", projects, default=projects)
 dev_sel = st.sidebar.multiselect("Group Name", group_names, default=group_names)
 
-df = clean_and_filter(df_raw, dev_grp_filter=dev_sel, project_filter=proj_sel)
+df = apply_filters(df_raw, dev_grp_filter=frozenset(dev_sel), project_filter=frozenset(proj_sel))
 summary = build_summary(df)
 
 # -------------------------------------------------------------------
@@ -199,17 +338,28 @@ st.title("SAS to ETL Migration Dashboard")
 def kpi(label, value, help_text=None):
     st.metric(label, value, help=help_text)
 
+def distinct_count(df, col):
+    if col not in df.columns:
+        return 0
+    if hasattr(df[col], "cat"):
+        # Categorical: count the categories still in use, not hashed values
+        return len(df[col].cat.remove_unused_categories().cat.categories)
+    return df[col].nunique()
+
 total_records = len(df)
-distinct_projects = df["project"].nunique() if "project" in df.columns else 0
-distinct_dev_groups = df["dev_grp_name"].nunique() if "dev_grp_name" in df.columns else 0
-
-flag_totals = {
-    "Spec Done": int(df["spec_done_cnt"].sum()),
-    "ETL Done": int(df["etl_done_cnt"].sum()),
-    "QA Completed": int(df["qa_done_cnt"].sum()),
-    "ACC Completed": int(df["acc_done_cnt"].sum()),
-    "PROD Implemented": int(df["prod_done_cnt"].sum()),
+distinct_projects = distinct_count(df, "project")
+distinct_dev_groups = distinct_count(df, "dev_grp_name")
+
+kpi_flag_cols = {
+    "Spec Done": "spec_done_cnt",
+    "ETL Done": "etl_done_cnt",
+    "QA Completed": "qa_done_cnt",
+    "ACC Completed": "acc_done_cnt",
+    "PROD Implemented": "prod_done_cnt",
 }
+# One reduction over the int8 flag block instead of a .sum() per column
+flag_sums = df[list(kpi_flag_cols.values())].sum()
+flag_totals = {label: int(flag_sums[col]) for label, col in kpi_flag_cols.items()}
 
 overall_completed = flag_totals["QA Completed"] + flag_totals["ACC Completed"] + flag_totals["PROD Implemented"]
 
@@ -236,7 +386,7 @@ st.divider()
 st.subheader("PROD Implemented vs Total by Dev Group (Overlay)")
 
 summary_by_group = (
-    summary.groupby("dev_grp_name", as_index=False)
+    summary.groupby("dev_grp_name", as_index=False, observed=True)
            .agg(
                total=("total", "sum"),
                prod_done=("prod_done", "sum"),
@@ -246,38 +396,44 @@ summary_by_group = (
 )
 
 if not summary_by_group.empty:
-    # Light bar = total, overlay bar = PROD
-    base = (
-        alt.Chart(summary_by_group)
-        .mark_bar(size=40, opacity=0.25)
-        .encode(
-            x=alt.X("dev_grp_name:N", title="Dev Group", sort="-y"),
-            y=alt.Y("total:Q", title="Total ETL Jobs"),
-            color=alt.Color("dev_grp_name:N", legend=None),
-            tooltip=[
-                alt.Tooltip("dev_grp_name:N", title="Dev Group"),
-                alt.Tooltip("total:Q", title="Total", format=",.0f"),
-            ],
-        )
+    # Light bar = total, overlay bar = PROD. Chart data goes in as an Arrow
+    # table, which Streamlit ships as Arrow IPC instead of inline JSON rows.
+    overlay_spec = {
+        "$schema": VEGA_LITE_SCHEMA,
+        "height": 360,
+        "layer": [
+            {
+                "mark": {"type": "bar", "size": 40, "opacity": 0.25},
+                "encoding": {
+                    "x": {"field": "dev_grp_name", "type": "nominal", "title": "Dev Group", "sort": "-y"},
+                    "y": {"field": "total", "type": "quantitative", "title": "Total ETL Jobs"},
+                    "color": {"field": "dev_grp_name", "type": "nominal", "legend": None},
+                    "tooltip": [
+                        {"field": "dev_grp_name", "type": "nominal", "title": "Dev Group"},
+                        {"field": "total", "type": "quantitative", "title": "Total", "format": ",.0f"},
+                    ],
+                },
+            },
+            {
+                "mark": {"type": "bar", "size": 26},
+                "encoding": {
+                    "x": {"field": "dev_grp_name", "type": "nominal", "sort": "-y"},
+                    "y": {"field": "prod_done", "type": "quantitative", "title": "PROD Implemented"},
+                    "color": {"field": "dev_grp_name", "type": "nominal", "title": "Dev Group"},
+                    "tooltip": [
+                        {"field": "dev_grp_name", "type": "nominal", "title": "Dev Group"},
+                        {"field": "prod_done", "type": "quantitative", "title": "PROD Implemented", "format": ",.0f"},
+                        {"field": "total", "type": "quantitative", "title": "Total", "format": ",.0f"},
+                    ],
+                },
+            },
+        ],
+    }
+    st.vega_lite_chart(
+        pa.Table.from_pandas(summary_by_group, preserve_index=False),
+        overlay_spec,
+        use_container_width=True,
     )
-
-    overlay = (
-        alt.Chart(summary_by_group)
-        .mark_bar(size=26)
-        .encode(
-            x=alt.X("dev_grp_name:N", sort="-y"),
-            y=alt.Y("prod_done:Q", title="PROD Implemented"),
-            color=alt.Color("dev_grp_name:N", title="Dev Group"),
-            tooltip=[
-                alt.Tooltip("dev_grp_name:N", title="Dev Group"),
-                alt.Tooltip("prod_done:Q", title="PROD Implemented", format=",.0f"),
-                alt.Tooltip("total:Q", title="Total", format=",.0f"),
-            ],
-        )
-    )
-
-    overlay_chart = alt.layer(base, overlay).properties(height=360)
-    st.altair_chart(overlay_chart, use_container_width=True)
 else:
     st.info("No data for overlay chart.")
 
@@ -289,21 +445,21 @@ card_cols = st.columns(4)
 
 def render_card(container, row):
     with container:
-        st.markdown(f"##### {row['dev_grp_name']}")
-        st.caption(row['project'])
+        st.markdown(f"##### {row.dev_grp_name}")
+        st.caption(row.project)
         col1, col2, col3 = st.columns(3)
         # First line of metrics
-        col1.metric("Rows", int(row["total"]))
-        col2.metric("Spec ✓", int(row["spec_done"]))
-        col3.metric("ETL ✓", int(row["etl_done"]))
+        col1.metric("Rows", row.total)
+        col2.metric("Spec ✓", row.spec_done)
+        col3.metric("ETL ✓", row.etl_done)
         # Second line: QA / ACC / PROD individually
-        col1.metric("QA ✓", int(row["qa_done"]))
-        col2.metric("ACC ✓", int(row["acc_done"]))
-        col3.metric("PROD ✓", int(row["prod_done"]))
+        col1.metric("QA ✓", row.qa_done)
+        col2.metric("ACC ✓", row.acc_done)
+        col3.metric("PROD ✓", row.prod_done)
 
         # Completion %: let's use PROD as "fully done", or you can change to QA+ACC+PROD
-        denom = row["total"] if row["total"] else 1
-        pct = round(100 * row["prod_done"] / denom)
+        denom = row.total if row.total else 1
+        pct = round(100 * row.prod_done / denom)
         st.caption("Percent complete (PROD / Total)")
         st.progress(pct / 100)
 
@@ -312,7 +468,7 @@ summary_sorted = summary.sort_values(by=["project", "dev_grp_name"]).reset_index
 if summary_sorted.empty:
     st.info("No data after filters.")
 else:
-    for i, (_, r) in enumerate(summary_sorted.iterrows()):
+    for i, r in enumerate(summary_sorted.itertuples(index=False, name="Row")):
         render_card(card_cols[i % 4], r)
 
 st.divider()
@@ -321,48 +477,51 @@ st.divider()
 # Rollup Table
 # -------------------------------------------------------------------
 st.subheader("ETLs By Project and Dev Group")
-st.dataframe(summary, use_container_width=True)
+st.dataframe(summary_sorted, use_container_width=True)
 
 # -------------------------------------------------------------------
 # Counts by Metric (bar chart)
 # -------------------------------------------------------------------
 st.subheader("Counts by Metric")
 
-long_for_charts = summary.melt(
-    id_vars=["project", "dev_grp_name", "total"],
-    value_vars=[
-        "spec_done",
-        "etl_done",
-        "qa_done",
-        "acc_done",
-        "prod_done",
-    ],
-    var_name="metric",
-    value_name="count",
-)
+# Long form (one row per group × metric) straight from the summary's count
+# block: ids tiled per metric, counts flattened column by column.
+metric_cols = ["spec_done", "etl_done", "qa_done", "acc_done", "prod_done"]
+long_for_charts = pd.DataFrame({
+    "project": np.tile(summary["project"].to_numpy(), len(metric_cols)),
+    "dev_grp_name": np.tile(summary["dev_grp_name"].to_numpy(), len(metric_cols)),
+    "total": np.tile(summary["total"].to_numpy(), len(metric_cols)),
+    "metric": np.repeat(metric_cols, len(summary)),
+    "count": summary[metric_cols].to_numpy().ravel(order="F"),
+})
 
 if not long_for_charts.empty:
-    chart = (
-        alt.Chart(long_for_charts)
-        .mark_bar()
-        .encode(
-            x=alt.X("metric:N", title="Metric"),
-            y=alt.Y("count:Q", title="Count"),
-            color="project:N",
-            column=alt.Column(
-                "dev_grp_name:N",
-                title="Dev Group",
-                header=alt.Header(labelOrient="bottom"),
-            ),
-            tooltip=[
-                alt.Tooltip("project:N", title="Project"),
-                alt.Tooltip("dev_grp_name:N", title="Dev Group"),
-                alt.Tooltip("metric:N", title="Metric"),
-                alt.Tooltip("count:Q", title="Count", format=",.0f"),
+    chart_spec = {
+        "$schema": VEGA_LITE_SCHEMA,
+        "mark": "bar",
+        "height": 200,
+        "encoding": {
+            "x": {"field": "metric", "type": "nominal", "title": "Metric"},
+            "y": {"field": "count", "type": "quantitative", "title": "Count"},
+            "color": {"field": "project", "type": "nominal"},
+            "column": {
+                "field": "dev_grp_name",
+                "type": "nominal",
+                "title": "Dev Group",
+                "header": {"labelOrient": "bottom"},
+            },
+            "tooltip": [
+                {"field": "project", "type": "nominal", "title": "Project"},
+                {"field": "dev_grp_name", "type": "nominal", "title": "Dev Group"},
+                {"field": "metric", "type": "nominal", "title": "Metric"},
+                {"field": "count", "type": "quantitative", "title": "Count", "format": ",.0f"},
             ],
-        )
-        .properties(height=200)
+        },
+    }
+    st.vega_lite_chart(
+        pa.Table.from_pandas(long_for_charts, preserve_index=False),
+        chart_spec,
+        use_container_width=True,
     )
-    st.altair_chart(chart, use_container_width=True)
 else:
     st.info("No chart data.")
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(Path(__file__).resolve().parents[1] / "streamlit_kpi_dashboard.py")
+
+
+def run_with_saved_csv(tmp_path, monkeypatch, csv_text):
+    # The dashboard reads latest_etl.csv relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "latest_etl.csv").write_text(csv_text)
+    return AppTest.from_file(APP_PATH, default_timeout=30).run()
+
+
+def test_blank_dev_group_column_renders(tmp_path, monkeypatch):
+    at = run_with_saved_csv(
+        tmp_path,
+        monkeypatch,
+        "PRCS AREA CODE,Dev Group Name,Status\nA,,PROD\n",
+    )
+
+    assert not at.exception
+    assert not at.warning
+
+
+def test_all_cnn_file_is_loaded_but_empty(tmp_path, monkeypatch):
+    at = run_with_saved_csv(
+        tmp_path,
+        monkeypatch,
+        "PRCS AREA CODE,Dev Group Name,Status\nA,G1,CNN\nA,G2,CNN\n",
+    )
+
+    assert not at.exception
+    assert not at.warning
+    assert "No data after filters." in [i.value for i in at.info]